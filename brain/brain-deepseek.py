@@ -1,11 +1,15 @@
 import asyncio
+import functools
+import json
+import logging
 import os
+import re
 import time
 import subprocess
 
 import rclpy
 from rclpy.node import Node
-from typing import Optional
+from typing import Dict, Optional
 from contextlib import AsyncExitStack
 
 from std_srvs.srv import SetBool, Trigger
@@ -13,9 +17,11 @@ from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
 from anthropic import Anthropic
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 
+logger = logging.getLogger(__name__)
+
 sse_server_1_url = "http://127.0.0.1:8000/sse"
 # sse_server_2_url = "http://127.0.0.1:8001/sse"
 
@@ -33,13 +39,40 @@ system_prompt_en = '''
 
     the tools you can use are:
 '''
+
+
+@functools.lru_cache(maxsize=4)
+def _build_query_prompt(tool_sig) -> str:
+    """Build the tool-augmented system prompt for a (name, description) tuple.
+
+    Cached so reconnects that rediscover the same tools reuse the string.
+    """
+    return system_prompt_en + "".join(f"{name}: {desc}\n" for name, desc in tool_sig)
+
+
+
+# matches one "[FC]:funcname(para1=argu1, ...)" call, extracting the function
+# name and the raw argument blob in a single pass
+_FC_RE = re.compile(r"\[FC\]\s*:\s*(\w+)\(([^)]*)\)")
+_ARG_RE = re.compile(r"(\w+)\s*=\s*'?([^,']*)'?")
+
+
+def _stable_dumps(obj) -> str:
+    """Serialize tool args/results deterministically.
+
+    The message history is resent on every loop step; sorted keys keep
+    repeated structures byte-identical so the server-side prefix cache
+    can skip re-prefilling earlier turns.
+    """
+    try:
+        return json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return str(obj)
+
+
 # judge whether the message contains a tool call
 def judge_tool_call(content):
-    content_split = content.split("\n")
-    for i in content_split:
-        if "[FC]" in i:
-            return True
-    return False
+    return _FC_RE.search(content) is not None
 
 def tool_calls_format(tool_calls_str: str):
     '''
@@ -47,7 +80,7 @@ def tool_calls_format(tool_calls_str: str):
         [FC]:get_alerts(state=CA);
     }
     to
-    [    
+    [
         {
             "name": "get_alerts",
             "args": {
@@ -56,25 +89,16 @@ def tool_calls_format(tool_calls_str: str):
         }
     ]
     '''
-    tool_calls = []
-    tools_split = tool_calls_str.split("\n")
-    for i in tools_split:
-        if "[FC]" in i:
-            # 提取函数名称  [Funcall]:map_create();
-            funcName = i.split(":")[1].split("(")[0].strip()
-            # 提取参数
-            args_str = i.split("(")[1].split(")")[0].strip()
-            args_dict = {}
-            if args_str:
-                args_list = args_str.split(",")
-                for arg in args_list:
-                    key, value = arg.split("=")
-                    args_dict[key.strip()] = value.strip().strip("'")
-            tool_calls.append({
-                "name": funcName,
-                "args": args_dict
-            })
-    return tool_calls
+    return [
+        {
+            "name": match.group(1),
+            "args": {
+                key: value.strip()
+                for key, value in _ARG_RE.findall(match.group(2))
+            },
+        }
+        for match in _FC_RE.finditer(tool_calls_str)
+    ]
 
 # TODO:ros2 topic to get information
 class ClinetNodeController(Node):
@@ -126,61 +150,102 @@ class MCPClient:
         self.exit_stack = AsyncExitStack()
         self.available_tools = []
         self.tool_session_map = {}
-        self.client = OpenAI(
+        self.query_prompt = system_prompt_en
+        # async client so an in-flight completion does not block the event
+        # loop (the sync client would stall the MCP sessions for the whole
+        # LLM latency)
+        self.client = AsyncOpenAI(
             base_url="https://api.deepseek.com",
             api_key=api_key,
         )
 
+    async def _chat(self, messages) -> str:
+        """Stream a completion and return the accumulated content.
+
+        When the model emits a tool-call block, generation is aborted as
+        soon as the closing brace of the {...} block containing [FC] has
+        arrived - anything after it is never used, so there is no point
+        paying for the remaining decode tokens.
+        """
+        stream = await self.client.chat.completions.create(
+            model="deepseek-chat",
+            messages=messages,
+            stream=True,
+        )
+        chunks = []
+        tail = ""  # rolling window so "[FC]" split across chunks is still seen
+        saw_fc = False
+        depth = 0
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            chunks.append(delta)
+            if not saw_fc and "[FC]" in tail + delta:
+                saw_fc = True
+            tail = (tail + delta)[-4:]
+            for ch in delta:
+                if ch == "{":
+                    depth += 1
+                elif ch == "}":
+                    depth -= 1
+                    if depth <= 0 and saw_fc:
+                        await stream.close()
+                        return "".join(chunks)
+        return "".join(chunks)
+
+    async def _connect_one(self, server_url):
+        """Connect one SSE server and list its tools."""
+        read, write = await self.exit_stack.enter_async_context(sse_client(url=server_url))
+        # TODO : add connect error handler
+        session: ClientSession = await self.exit_stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+
+        # List available tools
+        response = await session.list_tools()
+        return session, response.tools
+
     async def connect_to_server(self):
         """Connect to an MCP server
-        
+
         Args:
             server_script_path: Path to the server script (.py)
         """
         available_tools = []
         tool_session_map: Dict[str, ClientSession] = {}
+        # connect sequentially: the SSE transport's anyio cancel scopes must
+        # be exited by the task that entered them, so every context on the
+        # shared exit stack has to be entered here, in the same task that
+        # later runs cleanup()
         for server_url in server_url_array:
-            read, write = await self.exit_stack.enter_async_context(sse_client(url=server_url))
-            # TODO : add connect error handler
-            session: ClientSession = await self.exit_stack.enter_async_context(ClientSession(read, write))
-            await session.initialize()
-        
-            # List available tools
-            response = await session.list_tools()
-            tools = response.tools
+            session, tools = await self._connect_one(server_url)
             for tool in tools:
                 if tool.name in tool_session_map:
-                    print(f"Tool: {tool.name}, exist")
+                    logger.debug("tool %s already registered, skipping", tool.name)
                 else :
                     available_tools.append(tool)
                     tool_session_map[tool.name] = session
-                    print(f"Tool: {tool.name}, Description: {tool.description}")
+                    # lazy %s formatting: the string is only built when the
+                    # record is actually emitted
+                    logger.info("tool: %s - %s", tool.name, tool.description)
         self.available_tools = available_tools
         self.tool_session_map = tool_session_map
+        # build the tool-augmented system prompt once here, the tool list does not
+        # change between queries and a byte-stable prompt lets the server reuse
+        # its prompt prefix cache across requests
+        self.query_prompt = _build_query_prompt(
+            tuple((tool.name, tool.description) for tool in available_tools)
+        )
 
     async def process_query(self, query: str) -> str:
 
-        # get available tools from server
-        available_tools = [{ 
-            "name": tool.name,
-            "description": tool.description,
-            "input_schema": tool.inputSchema
-        } for tool in self.available_tools]
+        # print(f"debug query_prompt: {self.query_prompt}\n\n\n")
 
-        
-        # current query tools
-        query_prompt = system_prompt_en
-        for tool in available_tools:
-            print(f"in this query Available tool: {tool['name']} - {tool['description']}")
-            query_prompt += f"{tool['name']}: {tool['description']}\n"
-
-        # print(f"debug query_prompt: {query_prompt}\n\n\n")
-        
         """Process a query using Claude and available tools"""
         messages = [
             {
                 "role": "system",
-                "content": query_prompt
+                "content": self.query_prompt
             },
             {
                 "role": "user",
@@ -190,15 +255,11 @@ class MCPClient:
 
         # Initial Claude API call - 本demo中替换成deepseek
         start_time = time.time()
-        response = self.client.chat.completions.create(
-            model="deepseek-chat",
-            messages=messages,
-            # tools=available_tools
-        )
+        content = await self._chat(messages)
         end_time = time.time()
-        
-        content = response.choices[0].message.content
-        print("debug response:\n", content, "\ndebug take time:", end_time - start_time)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("response:\n%s\ntake time: %s", content, end_time - start_time)
         
         # Process response and handle tool calls
         tool_results = []
@@ -207,43 +268,50 @@ class MCPClient:
         while judge_tool_call(content) == True:
             
             tool_calls = tool_calls_format(content[content.find("{"):content.rfind("}") + 1]) # str -> list
-            print("debug tool_calls:\n", tool_calls)
-            for tool in tool_calls:
+            logger.debug("tool_calls: %s", tool_calls)
+
+            # eg : result = await self.session.call_tool("get_alerts", {"state": "CA"})
+            # eg : result = await self.session.call_tool("get_forecast", {"latitude": 37.7749, "longitude": -122.4194})
+            # the tool calls in one batch are independent, dispatch them all at
+            # once so the wall-clock cost is the slowest call instead of the sum
+            results = await asyncio.gather(
+                *[
+                    self.tool_session_map[tool["name"]].call_tool(tool["name"], tool["args"])
+                    for tool in tool_calls
+                ]
+            )
+
+            result_lines = []
+            for tool, result in zip(tool_calls, results):
                 tool_name = tool["name"]
                 tool_args = tool["args"]
-                
-                print(f"debug tool call: {tool_name} with args {tool_args}")
-
-                # eg : result = await self.session.call_tool("get_alerts", {"state": "CA"})
-                # eg : result = await self.session.call_tool("get_forecast", {"latitude": 37.7749, "longitude": -122.4194})
-                result = await self.tool_session_map[tool_name].call_tool(tool_name, tool_args)
-                
+                logger.debug("tool call: %s with args %s", tool_name, tool_args)
                 tool_results.append({
                     "call": tool_name,
                     "result": result.content
                 })
                 final_text.append(f"[Calling tool {tool_name} with args {tool_args}]")
-                
-                # add llm response to messages
-                messages.append({
-                    "role": "assistant",
-                    "content": content
-                })
-                
-                # add tool call result to messages
-                messages.append({
-                    "role": "user",
-                    "content": f"Calling tool {tool_name} with args {tool_args} returned: {result.content}",
-                })
-                
-                # Get next response from llm
-                response = self.client.chat.completions.create(
-                    model="deepseek-chat",
-                    messages=messages,
+                result_lines.append(
+                    f"Calling tool {tool_name} with args {_stable_dumps(tool_args)} "
+                    f"returned: {_stable_dumps(result.content)}"
                 )
 
-                # loop through response content
-                content = response.choices[0].message.content
+            # history is append-only: earlier entries are never rewritten, so
+            # every request shares a byte-identical prefix with the previous
+            # one and only the new turn needs prefill
+            messages.append({
+                "role": "assistant",
+                "content": content
+            })
+
+            # add all tool call results to messages
+            messages.append({
+                "role": "user",
+                "content": "\n".join(result_lines),
+            })
+
+            # Get next response from llm
+            content = await self._chat(messages)
         
         # out of loop, no more tool calls
         final_text.append(content)
@@ -257,7 +325,9 @@ class MCPClient:
 
         while True:
             try:
-                query = input("\nQuery: ").strip()
+                # read stdin in a worker thread so the event loop keeps
+                # servicing SSE heartbeats while the user types
+                query = (await asyncio.to_thread(input, "\nQuery: ")).strip()
                 # query = "统计10次统计hello node节点的状态，第5次时修改hello的名称为ROS2，第11次时关闭hello node节点"
 
                 if query.lower() == 'quit':
@@ -1,13 +1,20 @@
 # SPDX-License-Identifier: MulanPSL-2.0
 # Copyright (c) 2025, wheatfox <wheatfox17@icloud.com>
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
+import weakref
 from uapi.specs.skill_specs import EOS_SKILL_SPECS
-from uapi.log import logger
+from uapi.log import logger, is_debug_enabled
 import dataclasses
+import os
+
+# argument/return validation on primitive calls is a debug aid - set
+# DEEPEMBODY_VALIDATE=0 to bind primitives directly and pay zero
+# validation cost on the hot path
+VALIDATE_PRIMITIVES = os.environ.get("DEEPEMBODY_VALIDATE", "1") == "1"
 
 
 def format_primitive_error(primitive_name: str, error_type: str, details: str) -> str:
@@ -15,6 +22,112 @@ def format_primitive_error(primitive_name: str, error_type: str, details: str) -
     return f"{error_type}: {details} (primitive: {primitive_name})"
 
 
+def _compile_arg_matcher(expected_type) -> Callable[[Any], bool]:
+    """Compile an argument type spec into a matcher callable.
+
+    The spec shapes (alternatives list, dict structure, dataclass, Enum,
+    plain type) are resolved here once, so the per-call check is a plain
+    function call instead of re-dispatching on the spec shape every time.
+    """
+    if isinstance(expected_type, list):
+        if all(isinstance(alt, type) for alt in expected_type):
+            # alternatives of plain types collapse into the tuple form
+            # isinstance already supports - one C-level check instead of a
+            # Python loop over per-alternative matchers
+            types = tuple(expected_type)
+            return lambda value: isinstance(value, types)
+        alternatives = tuple(_compile_arg_matcher(alt) for alt in expected_type)
+        return lambda value: any(match(value) for match in alternatives)
+    if isinstance(expected_type, dict):
+        keys = frozenset(expected_type)
+        fields = tuple((k, _compile_arg_matcher(t)) for k, t in expected_type.items())
+
+        def match_dict(value):
+            if not isinstance(value, dict) or value.keys() != keys:
+                return False
+            return all(match(value[k]) for k, match in fields)
+
+        return match_dict
+    # dataclasses, Enum subclasses and plain types all reduce to isinstance
+    return lambda value: isinstance(value, expected_type)
+
+
+def _compile_return_matcher(expected_type) -> Callable[[Any], bool]:
+    """Compile a return type spec (including subscripted generics) once."""
+    if expected_type is Any:
+        return lambda value: True
+    if dataclasses.is_dataclass(expected_type):
+        fields = tuple(
+            (f.name, _compile_return_matcher(f.type))
+            for f in dataclasses.fields(expected_type)
+        )
+
+        def match_dataclass(value):
+            if not isinstance(value, expected_type):
+                return False
+            return all(match(getattr(value, name)) for name, match in fields)
+
+        return match_dataclass
+    if isinstance(expected_type, dict):
+        keys = frozenset(expected_type)
+        fields = tuple((k, _compile_return_matcher(t)) for k, t in expected_type.items())
+
+        def match_dict(value):
+            if not isinstance(value, dict) or value.keys() != keys:
+                return False
+            return all(match(value[k]) for k, match in fields)
+
+        return match_dict
+    origin = getattr(expected_type, "__origin__", None)
+    if origin in (list, List):
+        elem_match = _compile_return_matcher(expected_type.__args__[0])
+        return lambda value: isinstance(value, list) and all(
+            elem_match(v) for v in value
+        )
+    if origin is dict:
+        # for Dict[str, Any] we can't check the value types at runtime
+        return lambda value: isinstance(value, dict)
+    if origin is tuple:
+        elem_matches = tuple(
+            _compile_return_matcher(t) for t in expected_type.__args__
+        )
+
+        def match_tuple(value):
+            if not isinstance(value, tuple) or len(value) != len(elem_matches):
+                return False
+            return all(match(v) for match, v in zip(elem_matches, value))
+
+        return match_tuple
+    # Enum subclasses and plain types both reduce to isinstance
+    return lambda value: isinstance(value, expected_type)
+
+
+# matchers compiled lazily per primitive, shared by all entities since the
+# specs in EOS_SKILL_SPECS are static
+_ARG_MATCHERS: Dict[str, Dict[str, Callable[[Any], bool]]] = {}
+_RET_MATCHERS: Dict[str, Callable[[Any], bool]] = {}
+
+# global reverse indexes for O(1) entity lookup without walking a tree;
+# weak values so the registry never keeps a detached entity alive
+_ENTITY_BY_ID: "weakref.WeakValueDictionary[str, Entity]" = weakref.WeakValueDictionary()
+_ENTITY_BY_PATH: "weakref.WeakValueDictionary[str, Entity]" = weakref.WeakValueDictionary()
+
+
+def find_entity_by_id(entity_id: str) -> Optional["Entity"]:
+    """O(1) global lookup of an entity by its id."""
+    return _ENTITY_BY_ID.get(entity_id)
+
+
+def find_entity_by_path(path: str) -> Optional["Entity"]:
+    """
+    O(1) global lookup by absolute path.
+    Best-effort: covers entities whose path has been computed (via
+    get_absolute_path) since the last change of their parent chain; use
+    Entity.get_entity_by_path from a root for an authoritative walk.
+    """
+    return _ENTITY_BY_PATH.get(path)
+
+
 class EntityType(Enum):
     GENERIC = "generic"
     CONTROLLABLE = "controllable"
@@ -32,7 +145,7 @@ class RelationType(Enum):
     CHILD_OF = "child_of"
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityMetadata:
     name: str = ""
     description: str = ""
@@ -41,6 +154,32 @@ class EntityMetadata:
 
 class Entity:
 
+    # entities are allocated per room/object/robot, so avoid a per-instance
+    # __dict__ and make attribute access a fixed slot lookup
+    __slots__ = (
+        "entity_id",
+        "entity_type",
+        "entity_name",
+        "metadata",
+        "_parents",
+        "_parents_set",
+        "_children",
+        "_children_set",
+        "primitives",
+        "primitive_bindings",
+        "_primitive_wrappers",
+        "_arg_specs",
+        "_arg_key_sets",
+        "_ret_specs",
+        "is_active",
+        "created_at",
+        "updated_at",
+        "_abs_path_cache",
+        "_children_by_name",
+        # slotted classes drop weakref support unless it is declared back
+        "__weakref__",
+    )
+
     def __init__(
         self,
         entity_id: str,
@@ -54,24 +193,48 @@ class Entity:
         self.entity_name = entity_name
         self.metadata = metadata or EntityMetadata()
 
-        self.relations: Dict[str, List["Entity"]] = {
-            rel_type.value: [] for rel_type in RelationType
-        }
+        # relation storage: one flat list per relation kind (insertion order
+        # preserved) plus identity sets so membership checks don't scan the
+        # lists
+        self._parents: List["Entity"] = []
+        self._parents_set: set = set()
+        self._children: List["Entity"] = []
+        self._children_set: set = set()
+
+        # name -> child index kept in sync with the CHILD_OF relation so
+        # path lookups don't linear-scan the children list
+        self._children_by_name: Dict[str, "Entity"] = {}
 
-        self.primitives: List[str] = []
+        self.primitives: set[str] = set()
         self.primitive_bindings: Dict[str, callable] = {}
+        # validating wrappers built once in bind_skill, so __getattr__ does
+        # not rebuild a closure on every primitive call
+        self._primitive_wrappers: Dict[str, callable] = {}
+        # input/output specs resolved at bind time so the per-call checkers
+        # skip the EOS_SKILL_SPECS lookups
+        self._arg_specs: Dict[str, Any] = {}
+        self._arg_key_sets: Dict[str, frozenset] = {}
+        self._ret_specs: Dict[str, Any] = {}
 
         self.is_active = True
         self.created_at = None
         self.updated_at = None
 
+        # cached result of get_absolute_path, invalidated whenever the
+        # parent chain changes (see _invalidate_path_cache)
+        self._abs_path_cache: Optional[str] = None
+
+        _ENTITY_BY_ID[entity_id] = self
+
     def add_primitive(self, primitive: str) -> None:
-        if primitive not in self.primitives:
-            self.primitives.append(primitive)
+        self.primitives.add(primitive)
 
     def remove_primitive(self, primitive: str) -> None:
-        if primitive in self.primitives:
-            self.primitives.remove(primitive)
+        self.primitives.discard(primitive)
+        # drop the binding and its cached wrapper too, otherwise the
+        # primitive would still be callable after removal
+        self.primitive_bindings.pop(primitive, None)
+        self._primitive_wrappers.pop(primitive, None)
 
     def has_primitive(self, primitive: str) -> bool:
         return primitive in self.primitives
@@ -79,26 +242,67 @@ class Entity:
     def add_relation(
         self, relation_type: RelationType, target_entity: "Entity"
     ) -> None:
-        if target_entity not in self.relations[relation_type.value]:
-            self.relations[relation_type.value].append(target_entity)
+        if relation_type is RelationType.CHILD_OF:
+            if target_entity not in self._children_set:
+                self._children.append(target_entity)
+                self._children_set.add(target_entity)
+                # first-added wins for duplicate names, matching the linear
+                # scan this index replaced
+                self._children_by_name.setdefault(
+                    target_entity.entity_name, target_entity
+                )
+                self._invalidate_path_cache()
+        else:
+            if target_entity not in self._parents_set:
+                self._parents.append(target_entity)
+                self._parents_set.add(target_entity)
+                self._invalidate_path_cache()
 
     def remove_relation(
         self, relation_type: RelationType, target_entity: "Entity"
     ) -> None:
-        if target_entity in self.relations[relation_type.value]:
-            self.relations[relation_type.value].remove(target_entity)
-
-    def get_relations(self, relation_type: RelationType) -> List["Entity"]:
-        return self.relations[relation_type.value].copy()
+        if relation_type is RelationType.CHILD_OF:
+            if target_entity in self._children_set:
+                self._children.remove(target_entity)
+                self._children_set.discard(target_entity)
+                if self._children_by_name.get(target_entity.entity_name) is target_entity:
+                    del self._children_by_name[target_entity.entity_name]
+                    # if another child shares the name, re-point the index at it
+                    for child in self._children:
+                        if child.entity_name == target_entity.entity_name:
+                            self._children_by_name[child.entity_name] = child
+                            break
+                self._invalidate_path_cache()
+        else:
+            if target_entity in self._parents_set:
+                self._parents.remove(target_entity)
+                self._parents_set.discard(target_entity)
+                self._invalidate_path_cache()
+
+    def _invalidate_path_cache(self) -> None:
+        """Drop the cached absolute path of this entity and all descendants."""
+        if self._abs_path_cache is not None:
+            if _ENTITY_BY_PATH.get(self._abs_path_cache) is self:
+                del _ENTITY_BY_PATH[self._abs_path_cache]
+            self._abs_path_cache = None
+        for child in self._children:
+            child._invalidate_path_cache()
+
+    def get_relations(self, relation_type: RelationType) -> tuple:
+        # read-only snapshot; mutating relations must go through
+        # add_relation/remove_relation so the side indexes stay in sync
+        if relation_type is RelationType.CHILD_OF:
+            return tuple(self._children)
+        return tuple(self._parents)
 
     def add_parent(self, parent_entity: "Entity") -> None:
-        if parent_entity == self:
+        if parent_entity is self:
             raise ValueError("Entity cannot be its own parent")
         self.add_relation(RelationType.PARENT_OF, parent_entity)
         parent_entity.add_relation(RelationType.CHILD_OF, self)
 
     def add_child(self, child_entity: "Entity") -> None:
-        if child_entity == self:
+        if child_entity is self:
             raise ValueError("Entity cannot be its own child")
         self.add_relation(RelationType.CHILD_OF, child_entity)
         child_entity.add_relation(RelationType.PARENT_OF, self)
@@ -111,26 +315,37 @@ class Entity:
         self.remove_relation(RelationType.CHILD_OF, child_entity)
         child_entity.remove_relation(RelationType.PARENT_OF, self)
 
-    def get_parent(self) -> List["Entity"]:
-        parent = self.get_relations(RelationType.PARENT_OF)
-        if len(parent) > 1:
+    def get_parent(self) -> Optional["Entity"]:
+        # read the parent list directly - this runs at every level of a
+        # path walk, so skip the get_relations copy
+        parents = self._parents
+        if len(parents) > 1:
             raise ValueError("Entity has multiple parents")
-        return parent[0] if parent else None
+        return parents[0] if parents else None
+
+    def get_children(self) -> tuple:
+        return tuple(self._children)
 
-    def get_children(self) -> List["Entity"]:
-        return self.get_relations(RelationType.CHILD_OF)
+    def iter_children(self):
+        """Iterate children without materializing a copy."""
+        return iter(self._children)
 
     def is_root(self) -> bool:
-        return self.get_parent() is None
+        return not self._parents
 
     def get_absolute_path(self) -> str:
-        path = self.entity_name
-        parent = self.get_parent()
-        if parent:
-            if parent.is_root():
-                path = f"/{path}"
-            else:
-                path = f"{parent.get_absolute_path()}/{path}"
+        if self._abs_path_cache is not None:
+            return self._abs_path_cache
+        # cold path: collect the names up to the root and join once, instead
+        # of one recursive call plus one string concat per level
+        names = []
+        node = self
+        while not node.is_root():
+            names.append(node.entity_name)
+            node = node.get_parent()
+        path = "/" + "/".join(reversed(names)) if names else self.entity_name
+        self._abs_path_cache = path
+        _ENTITY_BY_PATH[path] = self
         return path
 
     def get_entity_by_path(self, path: str) -> Optional["Entity"]:
@@ -146,14 +361,8 @@ class Entity:
 
         current = self
         for name in path_split:
-            children = current.get_children()
-            found = False
-            for child in children:
-                if child.entity_name == name:
-                    current = child
-                    found = True
-                    break
-            if not found:
+            current = current._children_by_name.get(name)
+            if current is None:
                 return None  # Path does not exist
         return current
 
@@ -166,8 +375,43 @@ class Entity:
                 f"Primitive '{primitive_name}' is not a standard primitive."
             )
         self.primitive_bindings[primitive_name] = func
+        spec = EOS_SKILL_SPECS[primitive_name]
+        self._arg_specs[primitive_name] = spec["input"]
+        self._arg_key_sets[primitive_name] = frozenset(spec["input"] or ())
+        self._ret_specs[primitive_name] = spec["output"]
+        if VALIDATE_PRIMITIVES:
+            self._primitive_wrappers[primitive_name] = self._make_primitive_wrapper(
+                primitive_name, func
+            )
+        else:
+            # trusted mode: call the implementation directly
+            self._primitive_wrappers[primitive_name] = func
         self.add_primitive(primitive_name)
 
+    def _make_primitive_wrapper(self, name: str, func: callable) -> callable:
+        """Build the validating wrapper for a bound primitive once at bind time."""
+
+        def wrapper(**kwargs):
+            if is_debug_enabled():
+                logger.debug(
+                    f"[{self.get_absolute_path()}] calling primitive {name} with kwargs {kwargs}"
+                )
+            try:
+                self._check_primitive_args(name, kwargs)
+                result = func(**kwargs)
+                self._check_primitive_returns(name, result)
+                return result
+            except (ValueError, TypeError) as e:
+                logger.error(
+                    f"[{self.get_absolute_path()}] primitive '{name}' execution failed: {str(e)}"
+                )
+                # Create a custom exception with better formatting
+                error_msg = format_primitive_error(name, type(e).__name__, str(e))
+                custom_exc = type(e)(error_msg)
+                raise custom_exc from None
+
+        return wrapper
+
     def _is_type_match(self, value, expected_type):
         """
         Helper to check if value matches expected_type, where expected_type can be:
@@ -177,12 +421,11 @@ class Entity:
         - a dataclass
         - an Enum
         """
-        import dataclasses
-        from enum import Enum
-        from typing import List
-
-        # If expected_type is a list, treat as alternatives
+        # If expected_type is a list, treat as alternatives; a list of plain
+        # types is just isinstance against the tuple form
         if isinstance(expected_type, list):
+            if all(isinstance(alt, type) for alt in expected_type):
+                return isinstance(value, tuple(expected_type))
             for alt in expected_type:
                 if self._is_type_match(value, alt):
                     return True
@@ -210,11 +453,14 @@ class Entity:
         """
         Try to cast value to expected_type if possible, else return value as is.
         """
-        from enum import Enum
-        import dataclasses
-
         # If expected_type is a list, try each alternative
         if isinstance(expected_type, list):
+            # already an instance of one of the plain-type alternatives:
+            # nothing to cast
+            if all(isinstance(alt, type) for alt in expected_type) and isinstance(
+                value, tuple(expected_type)
+            ):
+                return value
             for alt in expected_type:
                 try:
                     return self._try_cast(value, alt)
@@ -253,14 +499,15 @@ class Entity:
         Attempts to cast arguments to expected types with warnings before raising errors.
         Now supports multiple alternative types for arguments (e.g., list of types/specs).
         """
-        # Log arguments with their types
-        arg_info = {k: f"{v} ({type(v).__name__})" for k, v in kwargs.items()}
-        logger.debug(
-            f"[{self.get_absolute_path()}] checking arguments for primitive '{primitive_name}': {arg_info}"
-        )
+        # Log arguments with their types - only pay for the formatting when
+        # DEBUG is actually emitted
+        if is_debug_enabled():
+            arg_info = {k: f"{v} ({type(v).__name__})" for k, v in kwargs.items()}
+            logger.debug(
+                f"[{self.get_absolute_path()}] checking arguments for primitive '{primitive_name}': {arg_info}"
+            )
 
-        spec = EOS_SKILL_SPECS[primitive_name]
-        expected_input = spec["input"]
+        expected_input = self._arg_specs[primitive_name]
 
         # Handle case where expected_args is None (no arguments required)
         if expected_input is None:
@@ -270,22 +517,33 @@ class Entity:
                     f"[{self.get_absolute_path()}] argument validation failed: {error_msg}"
                 )
                 raise ValueError(error_msg) from None
-            logger.debug(
-                f"[{self.get_absolute_path()}] argument validation passed for primitive '{primitive_name}' (no arguments required)"
-            )
+            if is_debug_enabled():
+                logger.debug(
+                    f"[{self.get_absolute_path()}] argument validation passed for primitive '{primitive_name}' (no arguments required)"
+                )
             return
 
-        # Handle case where expected_args is a dict (arguments with types required)
-        if set(kwargs.keys()) != set(expected_input.keys()):
+        # Handle case where expected_args is a dict (arguments with types
+        # required) - compare against the frozenset built at bind time so no
+        # per-call sets are allocated
+        if kwargs.keys() != self._arg_key_sets[primitive_name]:
             error_msg = f"Arguments for '{primitive_name}' must be {list(expected_input.keys())}, got {list(kwargs.keys())}"
             logger.error(
                 f"[{self.get_absolute_path()}] argument validation failed: {error_msg}"
             )
             raise ValueError(error_msg) from None
 
+        matchers = _ARG_MATCHERS.get(primitive_name)
+        if matchers is None:
+            matchers = {
+                arg_name: _compile_arg_matcher(expected_type)
+                for arg_name, expected_type in expected_input.items()
+            }
+            _ARG_MATCHERS[primitive_name] = matchers
+
         # Check argument types and attempt casting if needed
         for arg_name, expected_type in expected_input.items():
-            if not self._is_type_match(kwargs[arg_name], expected_type):
+            if not matchers[arg_name](kwargs[arg_name]):
                 # Try to cast the argument to one of the expected types
                 try:
                     original_value = kwargs[arg_name]
@@ -302,119 +560,70 @@ class Entity:
                     )
                     raise TypeError(error_msg) from None
 
-        logger.debug(
-            f"[{self.get_absolute_path()}] argument validation passed for primitive '{primitive_name}'"
-        )
+        if is_debug_enabled():
+            logger.debug(
+                f"[{self.get_absolute_path()}] argument validation passed for primitive '{primitive_name}'"
+            )
 
     def _check_primitive_returns(self, primitive_name: str, result):
         """
         Check if the return value matches the primitive spec, supporting dataclass, dict, list, and enum recursively.
         """
-        logger.debug(
-            f"[{self.get_absolute_path()}] checking return value for primitive '{primitive_name}': {result}"
-        )
+        if is_debug_enabled():
+            logger.debug(
+                f"[{self.get_absolute_path()}] checking return value for primitive '{primitive_name}': {result}"
+            )
 
-        spec = EOS_SKILL_SPECS[primitive_name]
-        expected_output = spec["output"]
-
-        def recursive_type_check(value, expected_type):
-            # Handle Any type - accept anything
-            if expected_type is Any:
-                return True
-            # Handle dataclass
-            if dataclasses.is_dataclass(expected_type):
-                if not isinstance(value, expected_type):
-                    return False
-                for field in dataclasses.fields(expected_type):
-                    v = getattr(value, field.name)
-                    t = field.type
-                    if not recursive_type_check(v, t):
-                        return False
-                return True
-            # Handle dict
-            if isinstance(expected_type, dict):
-                if not isinstance(value, dict):
-                    return False
-                if set(value.keys()) != set(expected_type.keys()):
-                    return False
-                for k in expected_type:
-                    if not recursive_type_check(value[k], expected_type[k]):
-                        return False
-                return True
-            # Handle list/tuple (only check type, not length)
-            if getattr(expected_type, "__origin__", None) in (list, List):
-                if not isinstance(value, list):
-                    return False
-                elem_type = expected_type.__args__[0]
-                return all(recursive_type_check(v, elem_type) for v in value)
-            # Handle dict with subscripted generics (e.g., Dict[str, Any])
-            if getattr(expected_type, "__origin__", None) is dict:
-                if not isinstance(value, dict):
-                    return False
-                # For Dict[str, Any], we can't check the actual types at runtime
-                # So we just check that it's a dict
-                return True
-            # Handle tuple with subscripted generics (e.g., Tuple[float, float, float], Tuple[Any, Any])
-            if getattr(expected_type, "__origin__", None) is tuple:
-                if not isinstance(value, tuple):
-                    return False
-                # Check tuple length matches expected length
-                if len(value) != len(expected_type.__args__):
-                    return False
-                # Check each element of the tuple
-                for i, elem_type in enumerate(expected_type.__args__):
-                    if not recursive_type_check(value[i], elem_type):
-                        return False
-                return True
-            # Handle enum
-            if isinstance(expected_type, type) and issubclass(expected_type, Enum):
-                return isinstance(value, expected_type)
-            # Fallback: direct isinstance
-            return isinstance(value, expected_type)
+        matcher = _RET_MATCHERS.get(primitive_name)
+        if matcher is None:
+            matcher = _compile_return_matcher(self._ret_specs[primitive_name])
+            _RET_MATCHERS[primitive_name] = matcher
 
-        if not recursive_type_check(result, expected_output):
+        if not matcher(result):
+            expected_output = self._ret_specs[primitive_name]
             error_msg = f"Return value for '{primitive_name}' does not match expected type {expected_output}"
             logger.error(
                 f"[{self.get_absolute_path()}] return type validation failed: {error_msg}"
             )
             raise TypeError(error_msg) from None
 
-        logger.debug(
-            f"[{self.get_absolute_path()}] return value validation passed for primitive '{primitive_name}'"
-        )
+        if is_debug_enabled():
+            logger.debug(
+                f"[{self.get_absolute_path()}] return value validation passed for primitive '{primitive_name}'"
+            )
+
+    def get_primitive(self, name: str) -> Callable:
+        """Return the bound primitive callable without going through
+        __getattr__.
+
+        Attribute access on a slotted class reaches __getattr__ only after
+        the normal lookup has raised internally; hoisting the callable out
+        of a tight loop (``move = ent.get_primitive("c_space_move")``)
+        skips that miss-and-dispatch cost on every iteration.
+        """
+        try:
+            return self._primitive_wrappers[name]
+        except KeyError:
+            raise AttributeError(
+                f"primitive '{name}' is not bound, available primitives for {self.get_absolute_path()}: {sorted(self.primitives)}"
+            ) from None
 
     def __getattr__(self, name):
         # https://www.sefidian.com/2021/06/06/python-__getattr__-and-__getattribute__-magic-methods/
         # getattr is called when an attribute is not found in the object, while __getattribute__ is called no matter found or not
         # we use getattr to "bind" primitives to the entity - wheatfox
-        if name in self.primitive_bindings:
-
-            def wrapper(**kwargs):
-                logger.debug(
-                    f"[{self.get_absolute_path()}] calling primitive {name} with kwargs {kwargs}"
-                )
-                try:
-                    self._check_primitive_args(name, kwargs)
-                    result = self.primitive_bindings[name](**kwargs)
-                    self._check_primitive_returns(name, result)
-                    return result
-                except (ValueError, TypeError) as e:
-                    logger.error(
-                        f"[{self.get_absolute_path()}] primitive '{name}' execution failed: {str(e)}"
-                    )
-                    # Create a custom exception with better formatting
-                    error_msg = format_primitive_error(name, type(e).__name__, str(e))
-                    custom_exc = type(e)(error_msg)
-                    raise custom_exc from None
-
+        wrapper = self._primitive_wrappers.get(name)
+        if wrapper is not None:
             return wrapper
         raise AttributeError(
-            f"'{type(self).__name__}' object has no attribute '{name}', or this primitive is not bound, available primitives for {self.get_absolute_path()}: {self.primitives}"
+            f"'{type(self).__name__}' object has no attribute '{name}', or this primitive is not bound, available primitives for {self.get_absolute_path()}: {sorted(self.primitives)}"
         )
 
 
 class Room(Entity):
 
+    __slots__ = ("capacity", "room_type", "is_accessible")
+
     def __init__(
         self,
         room_id: str,
@@ -434,23 +643,23 @@ class Room(Entity):
 
 
 def create_generic_entity(entity_name: str, **kwargs) -> Entity:
-    return Entity(uuid.uuid4(), EntityType.GENERIC, entity_name, **kwargs)
+    return Entity(uuid.uuid4().hex, EntityType.GENERIC, entity_name, **kwargs)
 
 
 def create_controllable_entity(entity_name: str, **kwargs) -> Entity:
-    return Entity(uuid.uuid4(), EntityType.CONTROLLABLE, entity_name, **kwargs)
+    return Entity(uuid.uuid4().hex, EntityType.CONTROLLABLE, entity_name, **kwargs)
 
 
 def create_computing_entity(entity_name: str, **kwargs) -> Entity:
-    return Entity(uuid.uuid4(), EntityType.COMPUTING, entity_name, **kwargs)
+    return Entity(uuid.uuid4().hex, EntityType.COMPUTING, entity_name, **kwargs)
 
 
 def create_human_entity(entity_name: str, **kwargs) -> Entity:
-    return Entity(uuid.uuid4(), EntityType.HUMAN, entity_name, **kwargs)
+    return Entity(uuid.uuid4().hex, EntityType.HUMAN, entity_name, **kwargs)
 
 
 def create_room_entity(room_name: str, room_type: str = "generic", **kwargs) -> Room:
-    room = Room(uuid.uuid4(), room_name, **kwargs)
+    room = Room(uuid.uuid4().hex, room_name, **kwargs)
     room.room_type = room_type
     return room
 
@@ -17,6 +17,14 @@ class EAIOS_LOG_LEVEL(Enum):
 
 LOG_LEVEL = EAIOS_LOG_LEVEL.INFO
 
+
+def is_debug_enabled() -> bool:
+    """
+    Cheap guard for hot call sites: lets callers skip building expensive
+    debug messages (f-strings, dict comprehensions) when DEBUG is off.
+    """
+    return LOG_LEVEL == EAIOS_LOG_LEVEL.DEBUG
+
 # stacktrace
 install(show_locals=False, width=120, word_wrap=True, extra_lines=3)
 
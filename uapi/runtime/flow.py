@@ -1,7 +1,10 @@
 from enum import Enum
+import atexit
 import threading
+import weakref
 import inspect
-from typing import Dict, List, Callable, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Callable, Any, TextIO
 from uapi.log import logger
 import os
 from datetime import datetime
@@ -15,6 +18,53 @@ class EOS_TYPE_FlowResult(Enum):
 
 __RUNTIME_INSTANCE__ = None
 
+# name of the flow currently executing on this thread, maintained by the
+# flow decorator so flow_print doesn't have to walk the call stack
+_FLOW_CTX = threading.local()
+
+# open log handles and resolved log paths, keyed so each flow pays the
+# open()/path-resolution cost once instead of per log line
+_LOG_HANDLES: Dict[str, TextIO] = {}
+_LOG_PATHS: Dict[tuple, str] = {}
+_LOG_LOCK = threading.Lock()
+
+
+def _close_log_handles():
+    with _LOG_LOCK:
+        for handle in _LOG_HANDLES.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        _LOG_HANDLES.clear()
+
+
+atexit.register(_close_log_handles)
+
+_ANSI_RESET = "\033[0m"
+_ANSI_CYAN = "\033[36m"  # timestamp and flow name
+_ANSI_WHITE = "\033[37m"  # message
+
+_LEVEL_COLORS = {
+    "DEBUG": "\033[36m",  # Cyan
+    "INFO": "\033[37m",  # White
+    "WARN": "\033[33m",  # Yellow
+    "ERROR": "\033[31m",  # Red
+    "CRITICAL": "\033[35m",  # Magenta
+}
+
+# one console template per level, so flow_print only substitutes the
+# timestamp, flow name and message
+_LEVEL_TEMPLATES = {
+    level: (
+        f"FLOW_LOG:{_ANSI_CYAN}[{{timestamp}}]{_ANSI_RESET}"
+        f"{color}[{level}]{_ANSI_RESET}"
+        f"{_ANSI_CYAN}[{{flow_name}}]{_ANSI_RESET} "
+        f"{_ANSI_WHITE}{{message}}{_ANSI_RESET}"
+    )
+    for level, color in _LEVEL_COLORS.items()
+}
+
 
 def get_runtime():
     global __RUNTIME_INSTANCE__
@@ -27,6 +77,8 @@ def get_runtime():
 
 def flow(func: Callable) -> Callable:
     def wrapper(*args, **kwargs):
+        prev_flow = getattr(_FLOW_CTX, "name", None)
+        _FLOW_CTX.name = func.__name__
         try:
             result = func(*args, **kwargs)
             return result
@@ -35,6 +87,8 @@ def flow(func: Callable) -> Callable:
                 f"flow function {func.__name__} failed: {str(e)}", exc_info=True
             )
             return EOS_TYPE_FlowResult.FAILURE
+        finally:
+            _FLOW_CTX.name = prev_flow
 
     wrapper._is_flow = True
     wrapper._original_func = func
@@ -43,11 +97,63 @@ def flow(func: Callable) -> Callable:
     return wrapper
 
 
+# shared pool for overlapping independent, I/O-bound flows (logging, skill
+# RPCs); created lazily so programs that only ever call flows synchronously
+# never start worker threads
+_FLOW_POOL: "ThreadPoolExecutor | None" = None
+_FLOW_POOL_LOCK = threading.Lock()
+
+
+def _get_flow_pool() -> ThreadPoolExecutor:
+    global _FLOW_POOL
+    if _FLOW_POOL is None:
+        with _FLOW_POOL_LOCK:
+            if _FLOW_POOL is None:
+                _FLOW_POOL = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 4) * 4),
+                    thread_name_prefix="flow",
+                )
+    return _FLOW_POOL
+
+
+def flow_async(flow_func: Callable, *args, **kwargs) -> Future:
+    """Submit a flow to the shared pool and return its Future.
+
+    The flow-name context and flow_print are both thread-safe, so flows
+    running on pool threads log to the same per-flow files as synchronous
+    ones.
+    """
+    return _get_flow_pool().submit(flow_func, *args, **kwargs)
+
+
+def run_flows(flow_funcs: List[Callable], *args, **kwargs) -> List[Any]:
+    """Run independent flows concurrently and return their results in order.
+
+    Each function is called with the same args; the wall-clock cost is the
+    slowest flow instead of the sum, which only pays off when the flows
+    spend their time in I/O.
+    """
+    futures = [_get_flow_pool().submit(fn, *args, **kwargs) for fn in flow_funcs]
+    return [future.result() for future in futures]
+
+
+# weak keys so cached entries disappear with their module instead of
+# pinning unloaded programs in memory
+_FLOW_FUNCTIONS_CACHE = weakref.WeakKeyDictionary()
+
+
 def get_flow_functions(module) -> List[Callable]:
-    flow_functions = []
-    for name, obj in inspect.getmembers(module):
-        if inspect.isfunction(obj) and hasattr(obj, "_is_flow"):
-            flow_functions.append(obj)
+    cached = _FLOW_FUNCTIONS_CACHE.get(module)
+    if cached is not None:
+        return cached
+    # scan module.__dict__ directly, skipping the per-attribute getattr
+    # and sorting that inspect.getmembers does
+    flow_functions = [
+        obj
+        for obj in module.__dict__.values()
+        if inspect.isfunction(obj) and hasattr(obj, "_is_flow")
+    ]
+    _FLOW_FUNCTIONS_CACHE[module] = flow_functions
     return flow_functions
 
 
@@ -56,43 +162,40 @@ def set_runtime(runtime):
     __RUNTIME_INSTANCE__ = runtime
 
 
-def flow_print(message: str, level: str = "INFO"):
+_LEVEL_ORDER = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40, "CRITICAL": 50}
+# minimum level actually emitted; FLOW_LOG_LEVEL=INFO silences flow_debug
+# entirely - suppressed calls return before any formatting or I/O
+_MIN_LEVEL = _LEVEL_ORDER.get(
+    os.environ.get("FLOW_LOG_LEVEL", "DEBUG").upper(), _LEVEL_ORDER["DEBUG"]
+)
 
-    frame = inspect.currentframe()
-    caller_frame = frame.f_back
 
-    flow_name = "unknown"
-    if caller_frame:
-        for frame_info in inspect.stack():
-            func_name = frame_info.function
-            if func_name in frame_info.frame.f_globals:
-                func_obj = frame_info.frame.f_globals[func_name]
-                if hasattr(func_obj, "_is_flow"):
-                    flow_name = func_name
-                    break
+def flow_print(message: str, level: str = "INFO"):
+    if _LEVEL_ORDER.get(level.upper(), _LEVEL_ORDER["INFO"]) < _MIN_LEVEL:
+        return
+
+    flow_name = getattr(_FLOW_CTX, "name", None) or "unknown"
 
     thread_id = threading.get_ident()
     thread_name = threading.current_thread().name
 
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    # one datetime.now() feeds both the console and the file timestamp, with
+    # the millisecond part formatted directly instead of strftime + slicing
+    now = datetime.now()
+    ms = f"{now.microsecond // 1000:03d}"
+    timestamp = f"{now:%H:%M:%S}.{ms}"
 
-    colors = {
-        "DEBUG": "\033[36m",  # Cyan
-        "INFO": "\033[37m",  # White
-        "WARN": "\033[33m",  # Yellow
-        "ERROR": "\033[31m",  # Red
-        "CRITICAL": "\033[35m",  # Magenta
-        "RESET": "\033[0m",  # Reset
-        "WHITE": "\033[37m",  # White for message
-        "CYAN": "\033[36m",  # Cyan for timestamp and flow name
-        "YELLOW": "\033[33m",  # Yellow for level
-    }
+    level_upper = level.upper()
+    template = _LEVEL_TEMPLATES.get(level_upper)
+    if template is None:
+        # unknown levels keep their own tag with the INFO color
+        template = _LEVEL_TEMPLATES["INFO"].replace("[INFO]", f"[{level_upper}]")
+    console_message = template.format(
+        timestamp=timestamp, flow_name=flow_name, message=message
+    )
 
-    level_color = colors.get(level.upper(), colors["INFO"])
-    console_message = f"FLOW_LOG:{colors['CYAN']}[{timestamp}]{colors['RESET']}{level_color}[{level.upper()}]{colors['RESET']}{colors['CYAN']}[{flow_name}]{colors['RESET']} {colors['WHITE']}{message}{colors['RESET']}"
-
-    full_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-    file_message = f"[{full_timestamp}][{level.upper()}][{flow_name}][{thread_name}({thread_id})] {message}"
+    full_timestamp = f"{now:%Y-%m-%d %H:%M:%S}.{ms}"
+    file_message = f"[{full_timestamp}][{level_upper}][{flow_name}][{thread_name}({thread_id})] {message}"
 
     # Print to console
     print(console_message)
@@ -102,14 +205,25 @@ def flow_print(message: str, level: str = "INFO"):
         caller_frame = frame.f_back
         module_path = caller_frame.f_globals.get("__file__", "")
 
-        if module_path:
-            log_dir = os.path.dirname(os.path.abspath(module_path))
-        else:
-            log_dir = os.getcwd()
-
-        log_file = os.path.join(log_dir, f"{flow_name}.log")
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(file_message + "\n")
+        path_key = (module_path, flow_name)
+        log_file = _LOG_PATHS.get(path_key)
+        if log_file is None:
+            if module_path:
+                log_dir = os.path.dirname(os.path.abspath(module_path))
+            else:
+                log_dir = os.getcwd()
+            log_file = os.path.join(log_dir, f"{flow_name}.log")
+            _LOG_PATHS[path_key] = log_file
+
+        handle = _LOG_HANDLES.get(log_file)
+        if handle is None:
+            with _LOG_LOCK:
+                handle = _LOG_HANDLES.get(log_file)
+                if handle is None:
+                    handle = open(log_file, "a", encoding="utf-8")
+                    _LOG_HANDLES[log_file] = handle
+        handle.write(file_message + "\n")
+        handle.flush()
     except Exception as e:
         print(f"Warning: Could not write to log file: {e}")
 